@@ -0,0 +1,68 @@
+"""One-time conversion of Full.csv to Full.parquet for faster dashboard loads."""
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+OUTPUT_PATH = 'Full.parquet'
+
+DATE_COLUMNS = ['Activity date', 'Matter pending date', 'Matter close date']
+
+# Rows per CSV chunk; peak memory is one chunk rather than the whole file
+CHUNK_SIZE = 500_000
+
+# Explicit dtypes so every chunk produces the same Parquet schema, even when a
+# chunk happens to have a column that is entirely empty or whole-numbered
+TEXT_COLUMNS = [
+    'Matter description',
+    'Matter status',
+    'Practice area',
+    'Originating attorney',
+    'Matter stage',
+    'Matter location',
+    'User full name (first, last)',
+]
+FLOAT_COLUMNS = [
+    'Non-billable hours',
+    'Non-billable hours amount',
+    'Billable hours',
+    'Billable hours amount',
+    'Unbilled hours',
+    'Unbilled hours amount',
+    'Billed hours',
+    'Billed hours amount',
+    'Tracked hours',
+]
+
+def main():
+    dtype = {col: str for col in TEXT_COLUMNS}
+    dtype.update({col: 'float64' for col in FLOAT_COLUMNS})
+    
+    # Write next to the target and swap it in only once every chunk is written,
+    # so a failure partway through leaves the existing Full.parquet untouched
+    tmp_path = OUTPUT_PATH + '.tmp'
+    writer = None
+    rows = 0
+    try:
+        for chunk in pd.read_csv('Full.csv', parse_dates=DATE_COLUMNS, dtype=dtype, chunksize=CHUNK_SIZE):
+            if writer is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                for col in TEXT_COLUMNS:
+                    schema = schema.set(schema.get_field_index(col), pa.field(col, pa.string()))
+                writer = pq.ParquetWriter(tmp_path, schema, compression='snappy')
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if writer is not None:
+        writer.close()
+        os.replace(tmp_path, OUTPUT_PATH)
+    print(f"Wrote {OUTPUT_PATH} ({rows:,} rows)")
+
+if __name__ == "__main__":
+    main()
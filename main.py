@@ -1,40 +1,136 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 import calendar
 
+# Columns referenced by the dashboard; everything else is skipped at read time
+USED_COLUMNS = [
+    'Activity date',
+    'Non-billable hours',
+    'Billable hours',
+    'Billable hours amount',
+    'Unbilled hours',
+    'Billed hours',
+    'Billed hours amount',
+    'Tracked hours',
+    'Matter description',
+    'Matter status',
+    'Practice area',
+    'Originating attorney',
+    'Matter stage',
+    'Billable matter',
+    'Matter location',
+    'User full name (first, last)',
+]
+
+# Daily trend chart limits: roughly the plot's pixel width in days, and the point
+# count past which per-point markers dominate the figure payload
+TREND_MAX_DAYS = 400
+TREND_MARKER_MAX_DAYS = 120
+
+# Entries kept by each cache keyed on the filter state; the filter sliders are
+# continuous, so an unbounded cache would store a result for every position
+FILTER_CACHE_ENTRIES = 32
+
+# Repeatedly filtered and grouped string columns, stored as category codes
+CAT_COLS = [
+    'Practice area',
+    'Matter location',
+    'User full name (first, last)',
+    'Originating attorney',
+    'Matter status',
+    'Matter stage',
+    'Billable matter',
+    'Matter description',
+]
+
+@st.cache_data(show_spinner="Loading data…")
 def load_and_process_data():
-    """Load and process the full year CSV file."""
-    try:
-        # Load the CSV file directly
-        df = pd.read_csv('Full.csv', parse_dates=['Activity date', 'Matter pending date', 'Matter close date'])
-        
-        # Add derived date columns
-        df['year'] = df['Activity date'].dt.year
-        df['month'] = df['Activity date'].dt.month
-        df['month_name'] = df['Activity date'].dt.strftime('%B')
-        df['quarter'] = df['Activity date'].dt.quarter
-        
-        # Convert Matter description to string and handle missing values
-        df['Matter description'] = df['Matter description'].fillna('').astype(str)
-        df['Practice area'] = df['Practice area'].fillna('Unspecified')
-        df['Matter location'] = df['Matter location'].fillna('Unspecified')
-        
-        # Calculate additional metrics
-        df['Total hours'] = df['Billable hours'] + df['Non-billable hours']
-        df['Utilization rate'] = (df['Billable hours'] / df['Total hours'] * 100).fillna(0)
-        
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
-        return None
+    """Load and process the full year data file.
+    
+    Errors are raised rather than caught here, so a failed read is not cached.
+    """
+    # Load the Parquet file produced by convert_to_parquet.py; optional columns
+    # such as 'Matter stage' may be absent from the file
+    available = set(pq.read_schema('Full.parquet').names)
+    df = pd.read_parquet('Full.parquet', columns=[col for col in USED_COLUMNS if col in available])
+    
+    # Keep rows in date order so the trend resamples are a single linear pass
+    df = df.sort_values('Activity date', kind='stable')
+    
+    # Add derived date columns
+    df['year'] = df['Activity date'].dt.year
+    df['month'] = df['Activity date'].dt.month
+    df['month_name'] = pd.Categorical.from_codes(
+        df['month'].values - 1, categories=calendar.month_name[1:]
+    ).remove_unused_categories()
+    df['quarter'] = df['Activity date'].dt.quarter
+    
+    # Convert Matter description to string and handle missing values
+    df['Matter description'] = df['Matter description'].fillna('').astype(str)
+    df['Practice area'] = df['Practice area'].fillna('Unspecified')
+    df['Matter location'] = df['Matter location'].fillna('Unspecified')
+    for col in CAT_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')  # categories come out sorted
+    
+    # Calculate additional metrics
+    df['Total hours'] = df['Billable hours'] + df['Non-billable hours']
+    # Single pass over the arrays; rows with no hours keep a rate of 0
+    total_hours = df['Total hours'].values
+    utilization = np.zeros_like(total_hours)
+    np.divide(df['Billable hours'].values, total_hours, out=utilization, where=total_hours != 0)
+    utilization *= 100
+    df['Utilization rate'] = utilization
+    
+    # Derived date parts fit in uint8/uint16; hour and amount columns stay float64,
+    # since float32 cannot represent one-decimal values such as 24.4 exactly
+    for col in ['year', 'month', 'quarter']:
+        df[col] = pd.to_numeric(df[col], downcast='unsigned')
+    
+    return df
 
-def create_sidebar_filters(df):
-    """Create comprehensive sidebar filters."""
+def _categories(series):
+    """Option list for a categorical column, read from its categories instead of scanning the rows."""
+    return series.cat.categories.tolist()
+
+@st.cache_data(show_spinner=False)
+def _sidebar_options(data_key, _df):
+    """Precompute the sidebar option lists and slider bounds for the loaded data."""
+    df = _df
+    return {
+        'years': sorted(df['year'].unique()),
+        'quarters': sorted(df['quarter'].unique().tolist()),
+        'months': _categories(df['month_name']),
+        'min_date': df['Activity date'].min(),
+        'max_date': df['Activity date'].max(),
+        'attorneys': _categories(df['User full name (first, last)']),
+        'originating_attorneys': _categories(df['Originating attorney']),
+        'max_bill_hours': float(df['Billable hours'].max()),
+        'practice_areas': _categories(df['Practice area']),
+        'locations': _categories(df['Matter location']),
+        'matter_status': _categories(df['Matter status']),
+        'matter_stage': _categories(df['Matter stage']) if 'Matter stage' in df.columns else None,
+        'billable_matter': _categories(df['Billable matter']),
+        'min_amount': float(df['Billable hours amount'].min()),
+        'max_amount': float(df['Billable hours amount'].max()),
+        'clients': _categories(df['Matter description']),
+        'max_client_hours': float(df.groupby('Matter description', observed=True, sort=False)['Billable hours'].sum().max()),
+    }
+
+def create_sidebar_filters(options):
+    """Create comprehensive sidebar filters from precomputed option lists."""
     st.sidebar.header("Filters")
     
+    # Slider bounds, computed once in _sidebar_options
+    bh_min = options['min_amount']
+    bh_max = options['max_amount']
+    bill_max = options['max_bill_hours']
+    
     # Initialize all filter variables with default values
     selected_attorneys = []
     selected_originating = []
@@ -55,43 +151,43 @@ def create_sidebar_filters(df):
         
         selected_year = st.selectbox(
             "Year",
-            options=sorted(df['year'].unique()),
-            index=len(df['year'].unique()) - 1
+            options=options['years'],
+            index=len(options['years']) - 1
         )
         
         selected_quarter = st.selectbox(
             "Quarter",
-            options=['All'] + sorted(df['quarter'].unique().tolist())
+            options=['All'] + options['quarters']
         )
         
         selected_months = st.multiselect(
             "Months",
-            options=sorted(df['month_name'].unique())
+            options=options['months']
         )
         
         date_range = st.date_input(
             "Custom Date Range",
-            value=(df['Activity date'].min(), df['Activity date'].max()),
-            min_value=df['Activity date'].min(),
-            max_value=df['Activity date'].max()
+            value=(options['min_date'], options['max_date']),
+            min_value=options['min_date'],
+            max_value=options['max_date']
         )
 
     with filter_tabs[1]:  # Attorney Filters
         st.subheader("Attorney Information")
         selected_attorneys = st.multiselect(
             "Attorneys",
-            options=sorted(df['User full name (first, last)'].unique())
+            options=options['attorneys']
         )
         
         selected_originating = st.multiselect(
             "Originating Attorneys",
-            options=sorted(df['Originating attorney'].dropna().unique())
+            options=options['originating_attorneys']
         )
         
         min_hours = st.slider(
             "Minimum Billable Hours",
             min_value=0.0,
-            max_value=float(df['Billable hours'].max()),
+            max_value=bill_max,
             value=0.0
         )
 
@@ -99,30 +195,30 @@ def create_sidebar_filters(df):
         st.subheader("Practice Areas")
         selected_practice_areas = st.multiselect(
             "Practice Areas",
-            options=sorted(df['Practice area'].unique())
+            options=options['practice_areas']
         )
         
         selected_locations = st.multiselect(
             "Locations",
-            options=sorted(df['Matter location'].unique())
+            options=options['locations']
         )
 
     with filter_tabs[3]:  # Matter Filters
         st.subheader("Matter Details")
         selected_matter_status = st.multiselect(
             "Matter Status",
-            options=sorted(df['Matter status'].dropna().unique())
+            options=options['matter_status']
         )
         
-        if 'Matter stage' in df.columns:
+        if options['matter_stage'] is not None:
             selected_matter_stage = st.multiselect(
                 "Matter Stage",
-                options=sorted(df['Matter stage'].dropna().unique())
+                options=options['matter_stage']
             )
         
         selected_billable_matter = st.multiselect(
             "Billable Matter",
-            options=sorted(df['Billable matter'].dropna().unique())
+            options=options['billable_matter']
         )
 
     with filter_tabs[4]:  # Financial Filters
@@ -130,28 +226,28 @@ def create_sidebar_filters(df):
         min_amount = st.number_input(
             "Minimum Billable Amount",
             min_value=0.0,
-            max_value=float(df['Billable hours amount'].max()),
+            max_value=bh_max,
             value=0.0
         )
         
         rate_range = st.slider(
             "Hourly Rate Range",
-            min_value=float(df['Billable hours amount'].min()),
-            max_value=float(df['Billable hours amount'].max()),
-            value=(float(df['Billable hours amount'].min()), float(df['Billable hours amount'].max()))
+            min_value=bh_min,
+            max_value=bh_max,
+            value=(bh_min, bh_max)
         )
 
     with filter_tabs[5]:  # Client Filters
         st.subheader("Client Information")
         selected_clients = st.multiselect(
             "Select Clients",
-            options=sorted(df['Matter description'].unique())
+            options=options['clients']
         )
         
         min_client_hours = st.slider(
             "Minimum Client Hours",
             min_value=0.0,
-            max_value=float(df.groupby('Matter description')['Billable hours'].sum().max()),
+            max_value=options['max_client_hours'],
             value=0.0
         )
 
@@ -170,7 +266,7 @@ def create_sidebar_filters(df):
         'practice_areas': selected_practice_areas,
         'locations': selected_locations,
         'matter_status': selected_matter_status,
-        'matter_stage': selected_matter_stage if 'Matter stage' in df.columns else [],
+        'matter_stage': selected_matter_stage if options['matter_stage'] is not None else [],
         'billable_matter': selected_billable_matter,
         'min_amount': min_amount,
         'rate_range': rate_range,
@@ -179,63 +275,103 @@ def create_sidebar_filters(df):
     }
 def filter_data(df, filters):
     """Apply all filters to the dataframe."""
-    filtered_df = df.copy()
+    # Build one boolean mask against the full frame and gather rows once at the end
+    mask = np.ones(len(df), dtype=bool)
     
     # Time filters using derived columns
     if filters['year']:
-        filtered_df = filtered_df[filtered_df['year'] == filters['year']]
+        mask &= df['year'].values == filters['year']
     if filters['quarter']:
-        filtered_df = filtered_df[filtered_df['quarter'] == filters['quarter']]
+        mask &= df['quarter'].values == filters['quarter']
     if filters['months']:
-        filtered_df = filtered_df[filtered_df['month_name'].isin(filters['months'])]
+        mask &= df['month_name'].isin(filters['months']).values
     if len(filters['date_range']) == 2:
-        filtered_df = filtered_df[
-            (filtered_df['Activity date'].dt.date >= filters['date_range'][0]) &
-            (filtered_df['Activity date'].dt.date <= filters['date_range'][1])
-        ]
+        # Compare on the datetime64 buffer; the end date is inclusive, so bound by the next midnight
+        start = np.datetime64(filters['date_range'][0], 'ns')
+        end = np.datetime64(filters['date_range'][1], 'ns') + np.timedelta64(1, 'D')
+        activity_dates = df['Activity date'].values
+        mask &= (activity_dates >= start) & (activity_dates < end)
     
     # Attorney filters
     if filters['attorneys']:
-        filtered_df = filtered_df[filtered_df['User full name (first, last)'].isin(filters['attorneys'])]
+        mask &= df['User full name (first, last)'].isin(filters['attorneys']).values
     if filters['originating_attorneys']:
-        filtered_df = filtered_df[filtered_df['Originating attorney'].isin(filters['originating_attorneys'])]
+        mask &= df['Originating attorney'].isin(filters['originating_attorneys']).values
     if filters['min_hours'] > 0:
-        attorney_hours = filtered_df.groupby('User full name (first, last)')['Billable hours'].sum()
-        valid_attorneys = attorney_hours[attorney_hours >= filters['min_hours']].index
-        filtered_df = filtered_df[filtered_df['User full name (first, last)'].isin(valid_attorneys)]
+        # Totals only count rows that passed the filters above
+        attorney_hours = (
+            df['Billable hours'].where(mask, 0)
+            .groupby(df['User full name (first, last)'], observed=True, sort=False).transform('sum')
+        )
+        mask &= (attorney_hours >= filters['min_hours']).values
     
     # Practice area filters
     if filters['practice_areas']:
-        filtered_df = filtered_df[filtered_df['Practice area'].isin(filters['practice_areas'])]
+        mask &= df['Practice area'].isin(filters['practice_areas']).values
     if filters['locations']:
-        filtered_df = filtered_df[filtered_df['Matter location'].isin(filters['locations'])]
+        mask &= df['Matter location'].isin(filters['locations']).values
     
     # Matter filters
     if filters['matter_status']:
-        filtered_df = filtered_df[filtered_df['Matter status'].isin(filters['matter_status'])]
+        mask &= df['Matter status'].isin(filters['matter_status']).values
     if filters['matter_stage']:
-        filtered_df = filtered_df[filtered_df['Matter stage'].isin(filters['matter_stage'])]
+        mask &= df['Matter stage'].isin(filters['matter_stage']).values
     if filters['billable_matter']:
-        filtered_df = filtered_df[filtered_df['Billable matter'].isin(filters['billable_matter'])]
+        mask &= df['Billable matter'].isin(filters['billable_matter']).values
     
     # Financial filters
+    amounts = df['Billable hours amount'].values
     if filters['min_amount'] > 0:
-        filtered_df = filtered_df[filtered_df['Billable hours amount'] >= filters['min_amount']]
+        mask &= amounts >= filters['min_amount']
     if len(filters['rate_range']) == 2:
-        filtered_df = filtered_df[
-            (filtered_df['Billable hours amount'] >= filters['rate_range'][0]) &
-            (filtered_df['Billable hours amount'] <= filters['rate_range'][1])
-        ]
+        mask &= (amounts >= filters['rate_range'][0]) & (amounts <= filters['rate_range'][1])
     
     # Client filters
     if filters['clients']:
-        filtered_df = filtered_df[filtered_df['Matter description'].isin(filters['clients'])]
+        mask &= df['Matter description'].isin(filters['clients']).values
     if filters['min_client_hours'] > 0:
-        client_hours = filtered_df.groupby('Matter description')['Billable hours'].sum()
-        valid_clients = client_hours[client_hours >= filters['min_client_hours']].index
-        filtered_df = filtered_df[filtered_df['Matter description'].isin(valid_clients)]
+        client_hours = (
+            df['Billable hours'].where(mask, 0)
+            .groupby(df['Matter description'], observed=True, sort=False).transform('sum')
+        )
+        mask &= (client_hours >= filters['min_client_hours']).values
     
-    return filtered_df
+    # With nothing filtered out (the default view), skip the full-frame gather
+    if mask.all():
+        return df
+    return df[mask]
+
+def _fingerprint(df):
+    """Cheap identity for a dataframe, used as a cache key in place of hashing its contents."""
+    return (df.shape, df['Activity date'].min(), df['Activity date'].max(), float(df['Billable hours'].sum()))
+
+def _filter_signature(filters):
+    """Canonical, hashable form of the filters dict, used as the cache key.
+    
+    Multiselect lists are sorted so the same selection made in a different order
+    maps to the same key; the date and rate ranges are already tuples.
+    """
+    return tuple(
+        (name, tuple(sorted(value)) if isinstance(value, list) else value)
+        for name, value in filters.items()
+    )
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def filter_data_cached(data_key, signature, _df):
+    """Cached filter_data, keyed on the data fingerprint and the filter signature."""
+    return filter_data(_df, dict(signature))
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def format_active_filters(filter_sig, _filters):
+    """Render the active filters as a single markdown block, or '' if none are set."""
+    active_filters = {k: v for k, v in _filters.items() if v}
+    if not active_filters:
+        return ''
+    lines = [
+        f"**{filter_name.replace('_', ' ').title()}:** {', '.join(map(str, filter_value)) if isinstance(filter_value, list) else filter_value}"
+        for filter_name, filter_value in active_filters.items()
+    ]
+    return "\n\n".join(["### Active Filters"] + lines)
+
 def display_key_metrics(df):
     """Display key metrics in the top row."""
     col1, col2, col3, col4 = st.columns(4)
@@ -275,14 +411,59 @@ def display_key_metrics(df):
             f"${avg_rate:.2f}/hr",
             "billable rate"
         )
-def create_hours_distribution(df):
+def _decategorize(frame):
+    """Return frame with categorical columns as plain values.
+
+    Plotly Express groups hierarchy paths with observed=False, so categorical
+    columns would add an empty node for every unused category.
+    """
+    return frame.astype({col: object for col in frame.select_dtypes('category').columns})
+
+# Hour and amount columns summed per client and per attorney
+SUM_COLUMNS = [
+    'Billable hours',
+    'Non-billable hours',
+    'Unbilled hours',
+    'Billed hours',
+    'Billable hours amount',
+    'Billed hours amount',
+    'Tracked hours',
+]
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def aggregate_by(filter_sig, key, _df):
+    """Sum all of SUM_COLUMNS per value of the categorical key column.
+    
+    Sums are accumulated straight into per-category bins with np.bincount on the
+    category codes, which needs neither a hash table nor sorted rows. Unobserved
+    categories and missing keys are dropped and NaN values count as 0, matching
+    groupby(observed=True).sum().
+    """
+    keys = _df[key]
+    categories = keys.cat.categories
+    codes = keys.cat.codes.values
+    present = codes >= 0
+    codes = codes[present]
+    
+    observed = np.bincount(codes, minlength=len(categories)) > 0
+    sums = {
+        col: np.bincount(codes, weights=np.nan_to_num(_df[col].values[present]), minlength=len(categories))[observed]
+        for col in SUM_COLUMNS
+    }
+    index = pd.CategoricalIndex(categories[observed], categories=categories, name=key)
+    return pd.DataFrame(sums, index=index)
+
+# Chart builders are cached on the filter signature; the filtered frame is passed
+# as _df so Streamlit skips hashing it (it is fully determined by the signature).
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_hours_distribution(filter_sig, _df):
     """Create hours distribution chart."""
     hours_data = pd.DataFrame({
         'Category': ['Billable', 'Non-Billable', 'Unbilled'],
         'Hours': [
-            df['Billable hours'].sum(),
-            df['Non-billable hours'].sum(),
-            df['Unbilled hours'].sum()
+            _df['Billable hours'].sum(),
+            _df['Non-billable hours'].sum(),
+            _df['Unbilled hours'].sum()
         ]
     })
     
@@ -294,12 +475,14 @@ def create_hours_distribution(df):
     )
     return fig
 
-def create_practice_area_analysis(df):
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_practice_area_analysis(filter_sig, _df):
     """Create practice area analysis chart."""
-    practice_data = df.groupby('Practice area').agg({
+    # px.bar lays the x axis out in row order, so sort the small result for a stable axis
+    practice_data = _df.groupby('Practice area', observed=True, sort=False).agg({
         'Billable hours': 'sum',
         'Billable hours amount': 'sum'
-    }).reset_index()
+    }).sort_index().reset_index()
     
     fig = px.bar(
         practice_data,
@@ -310,13 +493,10 @@ def create_practice_area_analysis(df):
     )
     return fig
 
-def create_attorney_performance(df):
-    """Create attorney performance chart."""
-    attorney_data = df.groupby('User full name (first, last)').agg({
-        'Billable hours': 'sum',
-        'Billed hours': 'sum',
-        'Billable hours amount': 'sum'
-    }).reset_index()
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_attorney_performance(filter_sig, _attorney_agg):
+    """Create attorney performance chart from the per-attorney sums."""
+    attorney_data = _attorney_agg[['Billable hours', 'Billed hours', 'Billable hours amount']].reset_index()
     
     fig = px.scatter(
         attorney_data,
@@ -328,13 +508,13 @@ def create_attorney_performance(df):
     )
     return fig
 
-def create_client_analysis_charts(df):
-    """Create client analysis visualizations."""
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_client_analysis_charts(filter_sig, _client_agg):
+    """Create client analysis visualizations from the per-client sums."""
     # Top clients by billable hours
-    top_clients = df.groupby('Matter description').agg({
-        'Billable hours': 'sum',
-        'Billable hours amount': 'sum'
-    }).sort_values('Billable hours', ascending=False).head(10)
+    top_clients = _client_agg[['Billable hours', 'Billable hours amount']].sort_values(
+        'Billable hours', ascending=False
+    ).head(10)
     
     fig1 = px.bar(
         top_clients,
@@ -345,14 +525,10 @@ def create_client_analysis_charts(df):
     )
     
     # Client hours distribution
-    client_hours = df.groupby('Matter description').agg({
-        'Billable hours': 'sum',
-        'Non-billable hours': 'sum',
-        'Unbilled hours': 'sum'
-    }).reset_index()
+    client_hours = _client_agg[['Billable hours', 'Non-billable hours', 'Unbilled hours']].reset_index()
     
     fig2 = px.treemap(
-        client_hours,
+        _decategorize(client_hours),
         path=['Matter description'],
         values='Billable hours',
         title='Client Hours Distribution'
@@ -360,46 +536,58 @@ def create_client_analysis_charts(df):
     
     return fig1, fig2
 
-def create_client_practice_area_chart(df):
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_client_practice_area_chart(filter_sig, _df):
     """Create client by practice area analysis."""
-    client_practice = df.groupby(['Matter description', 'Practice area']).agg({
+    client_practice = _df.groupby(['Matter description', 'Practice area'], observed=True, sort=False).agg({
         'Billable hours': 'sum'
     }).reset_index()
     
     fig = px.sunburst(
-        client_practice,
+        _decategorize(client_practice),
         path=['Practice area', 'Matter description'],
         values='Billable hours',
         title='Client Distribution by Practice Area'
     )
     return fig
 
-def create_trending_chart(df):
-    """Create trending analysis chart."""
-    daily_data = df.groupby('Activity date').agg({
-        'Billable hours': 'sum',
-        'Billed hours': 'sum',
-        'Non-billable hours': 'sum'
-    }).reset_index()
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def daily_hours(filter_sig, _df):
+    """Sum the trend hour columns per activity date."""
+    daily = (
+        _df[['Activity date', 'Billable hours', 'Billed hours', 'Non-billable hours']]
+        .set_index('Activity date')
+        .resample('D')
+        .sum(min_count=1)
+    )
+    # Only keep dates that have activity, as a groupby on the date would
+    return daily.dropna(how='all')
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_trending_chart(filter_sig, _daily):
+    """Create trending analysis chart from the daily sums."""
+    # Plot at most the most recent TREND_MAX_DAYS days, and drop markers on long series
+    daily_data = _daily.tail(TREND_MAX_DAYS).reset_index()
+    mode = 'lines' if len(daily_data) > TREND_MARKER_MAX_DAYS else 'lines+markers'
     
     fig = go.Figure()
     fig.add_trace(go.Scatter(
         x=daily_data['Activity date'],
         y=daily_data['Billable hours'],
         name='Billable Hours',
-        mode='lines+markers'
+        mode=mode
     ))
     fig.add_trace(go.Scatter(
         x=daily_data['Activity date'],
         y=daily_data['Billed hours'],
         name='Billed Hours',
-        mode='lines+markers'
+        mode=mode
     ))
     fig.add_trace(go.Scatter(
         x=daily_data['Activity date'],
         y=daily_data['Non-billable hours'],
         name='Non-billable Hours',
-        mode='lines+markers'
+        mode=mode
     ))
     
     fig.update_layout(
@@ -409,13 +597,10 @@ def create_trending_chart(df):
     )
     return fig
 
-def create_attorney_utilization_chart(df):
-    """Create attorney utilization chart."""
-    attorney_util = df.groupby('User full name (first, last)').agg({
-        'Billable hours': 'sum',
-        'Non-billable hours': 'sum',
-        'Tracked hours': 'sum'
-    }).reset_index()
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_attorney_utilization_chart(filter_sig, _attorney_agg):
+    """Create attorney utilization chart from the per-attorney sums."""
+    attorney_util = _attorney_agg[['Billable hours', 'Non-billable hours', 'Tracked hours']].reset_index()
     
     attorney_util['Utilization Rate'] = (
         attorney_util['Billable hours'] / attorney_util['Tracked hours'] * 100
@@ -432,30 +617,32 @@ def create_attorney_utilization_chart(df):
     fig.update_layout(xaxis_tickangle=-45)
     return fig
 
-def create_practice_area_sunburst(df):
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_practice_area_sunburst(filter_sig, _df):
     """Create practice area sunburst chart."""
-    practice_data = df.groupby(['Practice area', 'User full name (first, last)']).agg({
+    practice_data = _df.groupby(['Practice area', 'User full name (first, last)'], observed=True, sort=False).agg({
         'Billable hours': 'sum'
     }).reset_index()
     
     fig = px.sunburst(
-        practice_data,
+        _decategorize(practice_data),
         path=['Practice area', 'User full name (first, last)'],
         values='Billable hours',
         title='Practice Area Distribution by Attorney'
     )
     return fig
 
-def create_client_metrics_table(df):
-    """Create detailed client metrics table."""
-    client_metrics = df.groupby('Matter description').agg({
-        'Billable hours': 'sum',
-        'Billed hours': 'sum',
-        'Non-billable hours': 'sum',
-        'Billable hours amount': 'sum',
-        'Billed hours amount': 'sum',
-        'Tracked hours': 'sum'
-    }).round(2)
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def create_client_metrics_table(filter_sig, _client_agg):
+    """Create detailed client metrics table from the per-client sums."""
+    client_metrics = _client_agg[[
+        'Billable hours',
+        'Billed hours',
+        'Non-billable hours',
+        'Billable hours amount',
+        'Billed hours amount',
+        'Tracked hours'
+    ]].sort_index().round(2)
     
     # Calculate additional metrics
     client_metrics['Utilization Rate'] = (
@@ -487,24 +674,32 @@ def main():
     )
     
     # Load data
-    df = load_and_process_data()
+    try:
+        df = load_and_process_data()
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        df = None
     
     if df is not None:
         # Data range info
         st.info("Current data covers: December 2023 - December 2024")
         
         # Get filters
-        filters = create_sidebar_filters(df)
+        data_key = _fingerprint(df)
+        filters = create_sidebar_filters(_sidebar_options(data_key, _df=df))
         
         # Apply filters
-        filtered_df = filter_data(df, filters)
+        filter_sig = (data_key, _filter_signature(filters))
+        filtered_df = filter_data_cached(*filter_sig, _df=df)
+        
+        # Per-client and per-attorney sums shared by the charts and tables below
+        client_agg = aggregate_by(filter_sig, 'Matter description', _df=filtered_df)
+        attorney_agg = aggregate_by(filter_sig, 'User full name (first, last)', _df=filtered_df)
         
         # Show active filters
-        active_filters = {k: v for k, v in filters.items() if v}
-        if active_filters:
-            st.markdown("### Active Filters")
-            for filter_name, filter_value in active_filters.items():
-                st.markdown(f"**{filter_name.replace('_', ' ').title()}:** {', '.join(map(str, filter_value)) if isinstance(filter_value, list) else filter_value}")
+        active_filters_text = format_active_filters(filter_sig, _filters=filters)
+        if active_filters_text:
+            st.markdown(active_filters_text)
         
         # Display metrics and charts
         display_key_metrics(filtered_df)
@@ -517,13 +712,13 @@ def main():
             
             with col1:
                 st.plotly_chart(
-                    create_hours_distribution(filtered_df),
+                    create_hours_distribution(filter_sig, _df=filtered_df),
                     use_container_width=True
                 )
             
             with col2:
                 st.plotly_chart(
-                    create_practice_area_analysis(filtered_df),
+                    create_practice_area_analysis(filter_sig, _df=filtered_df),
                     use_container_width=True
                 )
             
@@ -540,7 +735,7 @@ def main():
         
         with main_tabs[1]:  # Client Analysis Tab
             # Client Analysis Section
-            client_bar, client_treemap = create_client_analysis_charts(filtered_df)
+            client_bar, client_treemap = create_client_analysis_charts(filter_sig, _client_agg=client_agg)
             
             col1, col2 = st.columns(2)
             with col1:
@@ -550,13 +745,13 @@ def main():
             
             # Client Practice Area Distribution
             st.plotly_chart(
-                create_client_practice_area_chart(filtered_df),
+                create_client_practice_area_chart(filter_sig, _df=filtered_df),
                 use_container_width=True
             )
             
             # Client Metrics Table
             st.subheader("Client Metrics")
-            client_metrics = create_client_metrics_table(filtered_df)
+            client_metrics = create_client_metrics_table(filter_sig, _client_agg=client_agg)
             st.dataframe(
                 client_metrics,
                 column_config={
@@ -589,26 +784,26 @@ def main():
             
             with col1:
                 st.plotly_chart(
-                    create_attorney_performance(filtered_df),
+                    create_attorney_performance(filter_sig, _attorney_agg=attorney_agg),
                     use_container_width=True
                 )
             
             with col2:
                 st.plotly_chart(
-                    create_attorney_utilization_chart(filtered_df),
+                    create_attorney_utilization_chart(filter_sig, _attorney_agg=attorney_agg),
                     use_container_width=True
                 )
             
             # Attorney Metrics Table
             st.subheader("Attorney Metrics")
-            attorney_metrics = filtered_df.groupby('User full name (first, last)').agg({
-                'Billable hours': 'sum',
-                'Non-billable hours': 'sum',
-                'Billed hours': 'sum',
-                'Billable hours amount': 'sum',
-                'Billed hours amount': 'sum',
-                'Tracked hours': 'sum'
-            }).round(2)
+            attorney_metrics = attorney_agg[[
+                'Billable hours',
+                'Non-billable hours',
+                'Billed hours',
+                'Billable hours amount',
+                'Billed hours amount',
+                'Tracked hours'
+            ]].sort_index().round(2)
             
             # Calculate additional metrics
             attorney_metrics['Utilization Rate'] = (
@@ -645,41 +840,34 @@ def main():
         with main_tabs[3]:  # Practice Areas Tab
             # Practice Area Distribution
             st.plotly_chart(
-                create_practice_area_sunburst(filtered_df),
+                create_practice_area_sunburst(filter_sig, _df=filtered_df),
                 use_container_width=True
             )
             
             # Practice Area Metrics Table
             st.subheader("Practice Area Metrics")
-            practice_metrics = filtered_df.groupby('Practice area').agg({
+            practice_metrics = filtered_df.groupby('Practice area', observed=True, sort=False).agg({
                 'Billable hours': 'sum',
                 'Non-billable hours': 'sum',
                 'Billed hours': 'sum',
                 'Billable hours amount': 'sum',
                 'Billed hours amount': 'sum'
-            }).round(2)
+            }).sort_index().round(2)
             
             st.dataframe(practice_metrics)
         
         with main_tabs[4]:  # Trending Tab
+            daily_data = daily_hours(filter_sig, _df=filtered_df)
             st.plotly_chart(
-                create_trending_chart(filtered_df),
+                create_trending_chart(filter_sig, _daily=daily_data),
                 use_container_width=True
             )
             
-            # Monthly trends
-            monthly_data = filtered_df.groupby([
-                pd.Grouper(key='Activity date', freq='M')
-            ]).agg({
-                'Billable hours': 'sum',
-                'Billed hours': 'sum',
-                'Non-billable hours': 'sum'
-            }).reset_index()
+            # Monthly trends, rolled up from the daily sums
+            monthly_data = daily_data.resample('ME').sum()
             
             st.subheader("Monthly Trends")
-            st.line_chart(
-                monthly_data.set_index('Activity date')
-            )
+            st.line_chart(monthly_data)
 
 if __name__ == "__main__":
     main()